@@ -0,0 +1,217 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+
+# Admission control Prometheus metrics
+ADMISSION_REJECTED = Counter(
+    'admission_rejected_total',
+    'Requests rejected by admission control',
+    ['method', 'endpoint', 'reason']
+)
+ADMISSION_QUEUED = Counter(
+    'admission_queued_total',
+    'Requests that had to wait for a concurrency slot',
+    ['method', 'endpoint']
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    'admission_queue_depth',
+    'Requests currently waiting for a concurrency slot',
+    ['method', 'endpoint']
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    'admission_in_flight',
+    'Requests currently being processed',
+    ['method', 'endpoint']
+)
+ADMISSION_LIMIT = Gauge(
+    'admission_concurrency_limit',
+    'Current adaptive concurrency limit',
+    ['method', 'endpoint']
+)
+
+
+class RouteLimiter:
+    """Adaptive concurrency limiter for a single route.
+
+    While the route is saturated the limit grows by one slot per window of
+    fast responses, and it shrinks multiplicatively when a response exceeds
+    the latency target (AIMD). A window is ``current_limit`` responses, and
+    the limit is cut at most once per window so that a burst of slow
+    responses only backs off once. Requests over the limit wait in a FIFO
+    queue for at most ``queue_timeout`` seconds before being rejected; the
+    queue only holds as many requests as the current limit can drain in
+    that time.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        initial_limit: int,
+        latency_target: float,
+        queue_timeout: float,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        max_queue: Optional[int] = None,
+        backoff_ratio: float = 0.9,
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.backoff_ratio = backoff_ratio
+
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.avg_latency: Optional[float] = None
+        self._responses_since_cut = 0
+        self._last_cut: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self._labels = {"method": method, "endpoint": endpoint}
+        ADMISSION_LIMIT.labels(**self._labels).set(self.current_limit)
+        ADMISSION_IN_FLIGHT.labels(**self._labels).set(0)
+        ADMISSION_QUEUE_DEPTH.labels(**self._labels).set(0)
+
+    @property
+    def current_limit(self) -> int:
+        """Integer number of requests allowed to run concurrently"""
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def retry_after(self) -> int:
+        """Suggested Retry-After value in seconds.
+
+        Estimates how long the current queue takes to drain plus one service
+        time, falling back to the queue timeout until latency is observed.
+        """
+        if self.avg_latency is None:
+            return max(1, math.ceil(self.queue_timeout))
+        queue_wait = len(self._waiters) / self.current_limit * self.avg_latency
+        return max(1, math.ceil(queue_wait + self.avg_latency))
+
+    @property
+    def queue_capacity(self) -> int:
+        """Queued requests that can expect a slot within the queue timeout"""
+        service_time = self.avg_latency or self.latency_target
+        capacity = int(self.current_limit * self.queue_timeout / service_time)
+        if self.max_queue is not None:
+            capacity = min(capacity, self.max_queue)
+        return capacity
+
+    async def acquire(self) -> Optional[str]:
+        """Wait for a concurrency slot.
+
+        Returns ``None`` once a slot is held, or the rejection reason.
+        """
+        if self.in_flight < self.current_limit and not self._waiters:
+            self._take_slot()
+            return None
+
+        if len(self._waiters) >= self.queue_capacity:
+            ADMISSION_REJECTED.labels(reason="queue_full", **self._labels).inc()
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        ADMISSION_QUEUED.labels(**self._labels).inc()
+        self._update_queue_depth()
+
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # Client went away while queued; hand the slot on if we got one
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._discard_waiter(waiter)
+            raise
+
+        if waiter.done():
+            # Slot was transferred to us by release()
+            return None
+
+        waiter.cancel()
+        self._discard_waiter(waiter)
+        ADMISSION_REJECTED.labels(reason="queue_timeout", **self._labels).inc()
+        return "queue_timeout"
+
+    def release(self, latency: float) -> None:
+        """Free a slot and adapt the limit to the observed latency"""
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency = 0.8 * self.avg_latency + 0.2 * latency
+
+        if latency > self.latency_target and self._can_cut():
+            self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+            self._responses_since_cut = 0
+            self._last_cut = time.monotonic()
+        else:
+            # Only probe for more capacity when the limit is actually in use
+            if latency <= self.latency_target and self.in_flight >= self.current_limit:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._responses_since_cut += 1
+        ADMISSION_LIMIT.labels(**self._labels).set(self.current_limit)
+
+        self._release_slot()
+
+    def _can_cut(self) -> bool:
+        # Only back off once per window of responses or latency target
+        if self._last_cut is None:
+            return True
+        if self._responses_since_cut >= self.current_limit:
+            return True
+        return time.monotonic() - self._last_cut >= self.latency_target
+
+    def _take_slot(self) -> None:
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.labels(**self._labels).set(self.in_flight)
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        # Hand freed slots straight to queued requests, oldest first
+        while self._waiters and self.in_flight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(True)
+        ADMISSION_IN_FLIGHT.labels(**self._labels).set(self.in_flight)
+        self._update_queue_depth()
+
+    def _discard_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._update_queue_depth()
+
+    def _update_queue_depth(self) -> None:
+        ADMISSION_QUEUE_DEPTH.labels(**self._labels).set(len(self._waiters))
+
+
+class AdmissionController:
+    """Registry of per-route limiters keyed by method and path"""
+
+    def __init__(self):
+        self._limiters: Dict[Tuple[str, str], RouteLimiter] = {}
+
+    def add_route(self, method: str, endpoint: str, **kwargs) -> RouteLimiter:
+        """Register a concurrency limit for a route"""
+        limiter = RouteLimiter(method, endpoint, **kwargs)
+        self._limiters[(method, endpoint)] = limiter
+        return limiter
+
+    def get(self, method: str, endpoint: str) -> Optional[RouteLimiter]:
+        """Return the limiter for a route, if one is configured"""
+        return self._limiters.get((method, endpoint))
@@ -11,6 +11,7 @@ from opentelemetry import trace
 from .models import HealthResponse, User, UserCreate, MessageResponse
 from .logging_config import setup_logging
 from .tracing_config import setup_tracing, get_tracer, create_span, add_span_attributes, add_span_event
+from .admission import AdmissionController
 
 # Setup logging
 logger = setup_logging()
@@ -22,6 +23,78 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Admission control for expensive endpoints. Limits only grow while a route
+# is saturated, and latency targets sit near the p95 of each route's service
+# time (POST /users 0.1-0.5s, /slow 2-5s) so the slow tail backs them off.
+# Queue timeouts cover a typical service time; the queue itself is bounded by
+# what the current limit can drain within that timeout.
+admission = AdmissionController()
+admission.add_route("POST", "/users", initial_limit=10, max_limit=50, latency_target=0.48, queue_timeout=1.0)
+admission.add_route("GET", "/slow", initial_limit=4, max_limit=20, latency_target=4.8, queue_timeout=5.0)
+
+
+# Registered before instrumentation so that it runs inside the tracing and
+# Prometheus middleware: shed requests still get a span and are counted as 503s
+@app.middleware("http")
+async def admission_control_middleware(request: Request, call_next):
+    limiter = admission.get(request.method, request.url.path)
+    if limiter is None:
+        return await call_next(request)
+
+    current_span = trace.get_current_span()
+    queue_start = time.time()
+    with get_tracer().start_as_current_span("admission_queue") as queue_span:
+        rejection = await limiter.acquire()
+        add_span_attributes(queue_span, {"admission.result": rejection or "admitted"})
+    queue_time = time.time() - queue_start
+    add_span_attributes(current_span, {
+        "admission.queue_time": queue_time,
+        "admission.concurrency_limit": limiter.current_limit,
+        "admission.in_flight": limiter.in_flight
+    })
+
+    if rejection is not None:
+        add_span_attributes(current_span, {
+            "admission.rejected": True,
+            "admission.reason": rejection
+        })
+        add_span_event(current_span, "admission_rejected")
+        logger.warning(
+            "Request rejected by admission control",
+            extra={
+                "method": request.method,
+                "endpoint": request.url.path,
+                "reason": rejection,
+                "concurrency_limit": limiter.current_limit,
+                "in_flight": limiter.in_flight,
+                "request_id": id(request)
+            }
+        )
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Service overloaded, retry later"},
+            headers={"Retry-After": str(limiter.retry_after)}
+        )
+
+    add_span_attributes(current_span, {"admission.rejected": False})
+    start_time = time.time()
+    if queue_time > 0.1:
+        logger.info(
+            "Request admitted after queueing",
+            extra={
+                "method": request.method,
+                "endpoint": request.url.path,
+                "queue_time": queue_time,
+                "request_id": id(request)
+            }
+        )
+
+    try:
+        return await call_next(request)
+    finally:
+        limiter.release(time.time() - start_time)
+
+
 # Initialize Prometheus metrics
 instrumentator = Instrumentator()
 instrumentator.instrument(app).expose(app)
@@ -159,7 +232,12 @@ async def metrics_info():
             "http_requests_total - Total HTTP requests",
             "http_request_duration_seconds - HTTP request latency", 
             "active_users_total - Total number of active users",
-            "http_errors_total - Total HTTP errors"
+            "http_errors_total - Total HTTP errors",
+            "admission_rejected_total - Requests rejected by admission control",
+            "admission_queued_total - Requests that waited for a concurrency slot",
+            "admission_queue_depth - Requests currently waiting for a concurrency slot",
+            "admission_in_flight - Requests currently being processed",
+            "admission_concurrency_limit - Current adaptive concurrency limit"
         ],
         "standard_metrics": "Available via prometheus-fastapi-instrumentator",
         "timestamp": datetime.utcnow()
@@ -415,7 +493,7 @@ async def slow_endpoint():
         })
         
         add_span_event(slow_span, "processing_started")
-        time.sleep(sleep_time)
+        await asyncio.sleep(sleep_time)
         add_span_event(slow_span, "processing_completed")
     
     add_span_attributes(current_span, {
@@ -455,7 +533,7 @@ async def simulate_processing():
     """Simulate random processing time"""
     # Random delay between 0.1 and 0.5 seconds
     delay = random.uniform(0.1, 0.5)
-    time.sleep(delay)
+    await asyncio.sleep(delay)
 
 
 if __name__ == "__main__":
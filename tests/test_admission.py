@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+
+from app.admission import RouteLimiter
+
+
+@pytest.fixture
+def main_module(tmp_path, monkeypatch):
+    # Keep log files out of the tree and spans away from Jaeger
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OTEL_TRACES_SAMPLER", "always_off")
+    from app import main
+    return main
+
+
+def make_limiter(endpoint, **kwargs):
+    options = {
+        "initial_limit": 1,
+        "latency_target": 1.0,
+        "queue_timeout": 10.0,
+    }
+    options.update(kwargs)
+    return RouteLimiter("GET", endpoint, **options)
+
+
+def test_queued_requests_are_admitted_in_order():
+    async def scenario():
+        limiter = make_limiter("/test/fifo")
+        assert await limiter.acquire() is None
+
+        admitted = []
+
+        async def queued(name):
+            assert await limiter.acquire() is None
+            admitted.append(name)
+
+        tasks = [asyncio.create_task(queued(name)) for name in ("a", "b", "c")]
+        await asyncio.sleep(0)
+        assert len(limiter._waiters) == 3
+
+        for _ in range(3):
+            limiter.release(0.1)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert admitted == ["a", "b", "c"]
+        assert limiter.in_flight == 1
+        assert not limiter._waiters
+
+    asyncio.run(scenario())
+
+
+def test_rejects_when_queue_is_full():
+    async def scenario():
+        limiter = make_limiter("/test/full", max_queue=1)
+        assert await limiter.acquire() is None
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert await limiter.acquire() == "queue_full"
+
+        limiter.release(0.1)
+        assert await waiting is None
+
+    asyncio.run(scenario())
+
+
+def test_rejects_after_queue_timeout():
+    async def scenario():
+        limiter = make_limiter("/test/timeout", latency_target=0.01, queue_timeout=0.05)
+        assert await limiter.acquire() is None
+
+        assert await limiter.acquire() == "queue_timeout"
+        assert limiter.in_flight == 1
+        assert not limiter._waiters
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak():
+    async def scenario():
+        limiter = make_limiter("/test/cancel")
+        assert await limiter.acquire() is None
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert not limiter._waiters
+        limiter.release(0.1)
+        assert limiter.in_flight == 0
+        assert await limiter.acquire() is None
+
+    asyncio.run(scenario())
+
+
+def test_queue_capacity_follows_current_limit():
+    limiter = make_limiter("/test/capacity", initial_limit=4, latency_target=4.0, queue_timeout=5.0)
+    assert limiter.queue_capacity == 5
+
+    limiter.limit = 8.0
+    assert limiter.queue_capacity == 10
+
+    limiter.max_queue = 3
+    assert limiter.queue_capacity == 3
+
+
+def test_limit_grows_by_one_per_window_of_saturated_fast_responses():
+    async def scenario():
+        limiter = make_limiter("/test/increase", initial_limit=4)
+        for _ in range(4):
+            assert await limiter.acquire() is None
+        for _ in range(4):
+            limiter.release(0.1)
+            assert await limiter.acquire() is None
+
+        assert 4.9 < limiter.limit < 5.0
+        assert limiter.current_limit == 4
+
+    asyncio.run(scenario())
+
+
+def test_limit_does_not_grow_without_saturation():
+    async def scenario():
+        limiter = make_limiter("/test/quiet", initial_limit=4)
+        for _ in range(200):
+            assert await limiter.acquire() is None
+            limiter.release(0.1)
+
+        assert limiter.limit == 4.0
+
+    asyncio.run(scenario())
+
+
+def test_slow_burst_cuts_limit_once_per_window():
+    async def scenario():
+        limiter = make_limiter("/test/decrease", initial_limit=10, latency_target=60.0)
+        for _ in range(10):
+            assert await limiter.acquire() is None
+        for _ in range(10):
+            limiter.release(120.0)
+
+        assert limiter.limit == pytest.approx(9.0)
+
+        # A full window later the limit may back off again
+        for _ in range(9):
+            assert await limiter.acquire() is None
+        for _ in range(9):
+            limiter.release(120.0)
+
+        assert limiter.limit == pytest.approx(8.1)
+
+    asyncio.run(scenario())
+
+
+def test_retry_after_uses_observed_latency_and_queue():
+    async def scenario():
+        limiter = make_limiter("/test/retry", initial_limit=2, queue_timeout=3.0)
+        assert limiter.retry_after == 3
+
+        assert await limiter.acquire() is None
+        limiter.release(0.4)
+        assert limiter.retry_after == 1
+
+        assert await limiter.acquire() is None
+        assert await limiter.acquire() is None
+        waiting = [asyncio.create_task(limiter.acquire()) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert limiter.retry_after == 2
+
+        for task in waiting:
+            task.cancel()
+        await asyncio.gather(*waiting, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_over_limit_request_gets_503(main_module, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    limiter = main_module.admission.get("GET", "/slow")
+    monkeypatch.setattr(limiter, "in_flight", limiter.current_limit)
+    monkeypatch.setattr(limiter, "max_queue", 0)
+
+    response = TestClient(main_module.app).get("/slow")
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_admission_runs_inside_instrumentation(main_module):
+    # Starlette runs user_middleware outermost first
+    innermost = main_module.app.user_middleware[-1]
+    assert innermost.options.get("dispatch") is main_module.admission_control_middleware